@@ -2,9 +2,11 @@
 
 """Pydantic-driven aiohttp-based Jookia API client."""
 
+from aiojolokia.batching import AsyncBatchingJolokiaClient
 from aiojolokia.client import JavaException, JolokiaClient
 from aiojolokia.models import (
     HistoricalValue,
+    HistorySeries,
     JolokiaRequest,
     JolokiaResponse,
     JolokiaVersion,
@@ -14,7 +16,9 @@ from aiojolokia.models import (
 )
 
 __all__ = (
+    "AsyncBatchingJolokiaClient",
     "HistoricalValue",
+    "HistorySeries",
     "JavaException",
     "JolokiaClient",
     "JolokiaRequest",
@@ -13,12 +13,13 @@ import asyncio
 
 from argparse import ArgumentParser, HelpFormatter, Namespace, RawDescriptionHelpFormatter
 from contextlib import suppress
+from functools import cache
 from typing import Any, Iterable
 
 from aiohttp import BasicAuth
 
 from aiojolokia.client import JolokiaClient
-from aiojolokia.models import JolokiaRequest, Operation
+from aiojolokia.models import JolokiaRequest
 
 __prog__ = "aiojolokia"
 __version__ = "0.1.0"
@@ -27,9 +28,13 @@ __author__ = "Alexander Pozlevich"
 __email__ = "apozlevich@gmail.com"
 __licence__ = "WTFPL"
 
+# `JolokiaRequest` fields which may be specified with command-line arguments
+_REQUEST_FIELDS = ("mbean", "attribute", "path", "value", "operation_name", "arguments")
 
-async def _main() -> None:
-    """Run as CLI utility."""
+
+@cache
+def _build_parser() -> ArgumentParser:
+    """Build command-line arguments parser once and reuse it on subsequent calls."""
 
     # Prepare root parser
     parent_parser = ArgumentParser(
@@ -121,26 +126,36 @@ async def _main() -> None:
         epilog="See https://jolokia.org/reference/html/protocol.html#version for more information.",
     )
 
+    return parent_parser
+
+
+async def _main() -> None:
+    """Run as CLI utility."""
+
     # Parse args and build auth tuple
-    args: Namespace = parent_parser.parse_args()
+    args: Namespace = _build_parser().parse_args()
     auth: BasicAuth | None = None
     if args.username:
         auth = BasicAuth(login=args.username, password=args.password)
 
-    # Instanciate client
-    client = JolokiaClient(base_url=args.base_url, auth=auth, raise_exceptions=False)
-
     # Build request model
-    kwargs: dict[str, Any | None] = {
-        key: args.__dict__.get(key) for key in ("mbean", "attribute", "path", "value", "operation", "arguments")
-    }
-    request = JolokiaRequest(type=Operation(args.request), **kwargs)
+    namespace: dict[str, Any] = vars(args)
+    kwargs: dict[str, Any | None] = {key: namespace.get(key) for key in _REQUEST_FIELDS}
+    request = JolokiaRequest(type=args.request, **kwargs)
+
+    # Instanciate client and output response
+    async with JolokiaClient(base_url=args.base_url, auth=auth, raise_exceptions=False) as client:
+        response: Iterable[Any] = await client.fetch_json((request,))
 
-    # Output response
-    response: Iterable[Any] = await client.fetch_json((request,))
     print(response)
 
 
 if __name__ == "__main__":
+    # Use faster libuv-based event loop if available
+    with suppress(ImportError):
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     with suppress(KeyboardInterrupt):
         asyncio.run(_main())
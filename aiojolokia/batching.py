@@ -0,0 +1,202 @@
+# -*- mode: python ; coding: utf-8 -*-
+
+"""Asynchronous batching of concurrent Jolokia requests into bulk requests."""
+
+import asyncio
+
+from contextlib import aclosing
+from types import TracebackType
+from typing import Any, AsyncGenerator, Iterable, Self, Sequence
+
+from aiojolokia.client import JolokiaClient
+from aiojolokia.models import JolokiaRequest, JolokiaResponse
+
+# Operation waiting in queue along with future receiving its result
+_Pending = tuple[JolokiaRequest, asyncio.Future[Any]]
+
+
+class AsyncBatchingJolokiaClient:
+    """Coalesces requests submitted concurrently by many callers into single Jolokia bulk POST requests."""
+
+    def __init__(
+        self,
+        client: JolokiaClient,
+        batch_size: int = 100,
+        wait_timeout: float = 0.005,
+        num_workers: int = 1,
+    ) -> None:
+        """
+        Coalesces requests submitted concurrently by many callers into single Jolokia bulk POST requests.
+
+        Args:
+            client: `JolokiaClient` used to send bulk requests, closed along with this client.
+            batch_size: maximum number of operations in one bulk request.
+            wait_timeout: seconds to wait for more operations after the first one arrived before sending the batch.
+            num_workers: number of batches which may be in flight simultaneously.
+        """
+
+        self._client: JolokiaClient = client
+        self._batch_size: int = batch_size
+        self._wait_timeout: float = wait_timeout
+        self._num_workers: int = num_workers
+
+        # Queue and workers are created lazily on first request, since event loop may not be running yet
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop workers, fail not yet answered operations and close underlying `JolokiaClient`."""
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Client was closed before request was sent."))
+
+            self._queue = None
+
+        await self._client.close()
+
+    @staticmethod
+    def _fail(batch: Iterable[_Pending], exc: BaseException) -> None:
+        """Pass exception to every caller of batch which is still waiting for result."""
+
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _collect(self, queue: asyncio.Queue[_Pending]) -> list[_Pending]:
+        """Wait for first operation and gather more until batch is full or `wait_timeout` expired."""
+
+        loop = asyncio.get_running_loop()
+
+        batch = [await queue.get()]
+        deadline: float = loop.time() + self._wait_timeout
+
+        try:
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                remaining: float = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except TimeoutError:
+                    break
+
+        # Operations already taken from queue would never be answered otherwise
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError("Client was closed before request was sent."))
+            raise
+
+        # Callers may have been cancelled while waiting
+        return [(request, future) for request, future in batch if not future.done()]
+
+    async def _worker(self, queue: asyncio.Queue[_Pending]) -> None:
+        """Send collected batches as bulk requests and pass every result to its caller."""
+
+        while True:
+            batch = await self._collect(queue)
+            if not batch:
+                continue
+
+            try:
+                results: Any = await self._client.fetch_json([request for request, _ in batch])
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Client was closed before response was received."))
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._fail(batch, exc)
+                continue
+
+            # Global error is returned as single object instead of array and concerns every operation
+            if not isinstance(results, Sequence):
+                results = [results] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+            # Operations left without result would never be answered otherwise
+            if len(results) != len(batch):
+                self._fail(
+                    batch[len(results) :],
+                    RuntimeError(f"Jolokia returned {len(results)} results for bulk request of {len(batch)} operations."),
+                )
+
+    def _submit(self, request: JolokiaRequest) -> asyncio.Future[Any]:
+        """Put operation into queue and return future which will receive its JSON result."""
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._workers = [asyncio.create_task(self._worker(self._queue)) for _ in range(self._num_workers)]
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+
+        return future
+
+    async def fetch_json(self, operations: Iterable[JolokiaRequest]) -> Iterable[Any]:
+        """
+        Send operations along with operations of concurrent callers and return JSON results in same order.
+
+        See https://jolokia.org/reference/html/protocol.html#post-request.
+        """
+
+        return await asyncio.gather(*(self._submit(request) for request in operations))
+
+    async def _results(self, operations: Iterable[JolokiaRequest]) -> AsyncGenerator[Any, None]:
+        """Submit operations and return their JSON results in same order, each as soon as its batch is answered."""
+
+        futures: list[asyncio.Future[Any]] = [self._submit(request) for request in operations]
+        try:
+            for future in futures:
+                yield await future
+        finally:
+            # Caller stopped iterating early, results of not yet sent operations are not needed anymore
+            for future in futures:
+                future.cancel()
+
+    async def request(
+        self,
+        operations: Iterable[JolokiaRequest],
+        strict: bool = False,
+    ) -> AsyncGenerator[JolokiaResponse, None]:
+        """
+        Send operations along with operations of concurrent callers and return response objects.
+
+        Behaves the same way as `JolokiaClient.request()` including `raise_exceptions` setting of underlying client.
+        Every response is returned as soon as its batch is answered, so there is no separate streaming mode.
+
+        Args:
+            operations: requests to send.
+            strict: set to `True` to validate every response with Pydantic instead of trusting Jolokia output.
+        """
+
+        # pylint: disable-next=protected-access
+        async with aclosing(self._client._iter_responses(self._results(operations), strict=strict)) as responses:
+            async for response in responses:
+                yield response
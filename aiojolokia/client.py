@@ -2,23 +2,54 @@
 
 """Pydantic-driven aiohttp-based Jookia API client."""
 
-from typing import Any, AsyncGenerator, Iterable, Sequence
+from contextlib import aclosing
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, AsyncGenerator, Iterable, Mapping, Self, Sequence
 
-from aiohttp import ClientSession
+import orjson
+
+from aiohttp import ClientSession, TCPConnector
 from aiohttp.helpers import BasicAuth
 from aiohttp.typedefs import StrOrURL
+from pydantic import TypeAdapter
+
+from aiojolokia.models import HistorySeries, JolokiaRequest, JolokiaResponse, JolokiaVersion, Operation
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
+# Size of response body chunks fed to incremental JSON parser when streaming
+_CHUNK_SIZE: int = 64 * 1024
 
-from aiojolokia.models import JolokiaRequest, JolokiaResponse, JolokiaVersion, Operation
+# Jolokia responds with JSON array for bulk requests, but with single object on global errors
+_RESPONSES: TypeAdapter[list[JolokiaResponse] | JolokiaResponse] = TypeAdapter(list[JolokiaResponse] | JolokiaResponse)
 
 
 class JavaException(Exception):
     """Raised based on error message from Jolokia if `raise_exceptions` is enabled."""
 
 
+@lru_cache(maxsize=256)
+def _exception_class(name: str) -> type[JavaException]:
+    """Generate `JavaException` subclass once per Java exception name and reuse it afterwards."""
+
+    return type(name, (JavaException,), {})
+
+
 class JolokiaClient:
     """Pydantic-driven aiohttp-based Jookia API client."""
 
-    def __init__(self, base_url: StrOrURL, auth: BasicAuth | None = None, raise_exceptions: bool = False) -> None:
+    def __init__(
+        self,
+        base_url: StrOrURL,
+        auth: BasicAuth | None = None,
+        raise_exceptions: bool = False,
+        max_conns: int = 100,
+        keepalive: float = 75,
+    ) -> None:
         """
         Pydantic-driven aiohttp-based Jookia API client.
 
@@ -26,11 +57,35 @@ class JolokiaClient:
             base_url: base Jolokia URL (usually `http://<host>:<post>/jolokia`)
             auth: tuple of `login` and `password` and optional `encoding` for HTTP Basic authentication.
             raise_exceptions: set to `True` to receive `ExceptionGroup` based on Jolokia error responses.
+            max_conns: maximum number of simultaneous connections to Jolokia.
+            keepalive: seconds to keep idle connection open, should exceed polling interval to reuse connections.
         """
 
         self._base_url = base_url
         self._auth: BasicAuth | None = auth
         self._raise: bool = raise_exceptions
+        self._max_conns: int = max_conns
+        self._keepalive: float = keepalive
+        self._session: ClientSession | None = None
+        self._version_cache: JolokiaVersion | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close underlying `aiohttp.ClientSession` if it was ever opened."""
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     @staticmethod
     def _build_exception(response: JolokiaResponse) -> Exception:
@@ -38,75 +93,250 @@ class JolokiaClient:
         Generate pythonic `Exception` from error response.
 
         For example if requesting `/jolokia/versio` (mistype), response will contain `error`, `error_type` and optional
-        `stacktrace` fields, which will be converted into newly-generated at runtime `Exception`-inherited class.
+        `stacktrace` fields, which will be converted into generated at runtime (once per name) `Exception`-inherited class.
 
         Last part of `error_type` field (e.g.) `java.lang.IllegalArgumentException` will be new class name,
         `error` field will be passed into exception as sole argument (`IllegalArgumentException(response.error)`) and
         `stacktrace`, if included, will be added to new exception instance with `.add_note()`.
         """
 
-        exc_name: str = response.error_type.split(".")[-1] if response.error_type else "Throwable"
+        exc_name: str = response.error_type.rpartition(".")[2] if response.error_type else "Throwable"
 
+        # Strip leading Java class name from error message if present
         exc_msg: str | None = None
         if response.error:
-            exc_msg = ": ".join(response.error.split(": ")[1:])
+            _, sep, rest = response.error.partition(": ")
+            exc_msg = rest if sep else response.error
 
-        exc_cls = type(exc_name, (JavaException,), {})
+        exc_cls = _exception_class(exc_name)
         exc = exc_cls(exc_msg) if exc_msg else exc_cls()
         if response.stacktrace:
             exc.add_note(response.stacktrace)
 
         return exc
 
-    async def fetch_json(self, operations: Iterable[JolokiaRequest]) -> Iterable[Any]:
+    @staticmethod
+    def _construct_response(result: Mapping[str, Any]) -> JolokiaResponse:
         """
-        Make bulk POST request to Jolokia and return JSON response.
+        Build `JolokiaResponse` from trusted Jolokia JSON skipping Pydantic validation.
 
-        See https://jolokia.org/reference/html/protocol.html#post-request.
+        Nested `request` and `history` are constructed the same way.
+        Only `status` field, which client relies on, is checked to fail early on malformed responses.
         """
 
-        # Serialize every operation into JSON array
-        data: str = "[" + ",".join(request.json(exclude_none=True) for request in operations) + "]"
+        if not isinstance(result, Mapping) or not isinstance(result.get("status"), int):
+            raise ValueError("Malformed Jolokia response: expected object with integer `status` field.")
+
+        fields: dict[str, Any] = dict(result)
+
+        if (request := fields.get("request")) is not None:
+            request = {**request, "type": Operation(request["type"])}
+
+            # Jolokia echoes exec operation under protocol key, which is `operation_name` field of the model
+            if "operation" in request:
+                request["operation_name"] = request.pop("operation")
 
-        # Send POST bulk request to Jolokia. This is not good to instanciate aiohttp.ClientSession on
-        # each request and better to do this in some kind of asynchonious .init() method, but this may
-        # lead to the situation when JolokiaClient is created before event loop even starts (e.g. on
-        # __module__ level before asyncio.run() or in .__init__() of any class, which is synchronous).
-        async with ClientSession(auth=self._auth) as session:
-            async with session.post(url=self._base_url, data=data) as jolokia_response:
-                return await jolokia_response.json(content_type=None)
+            fields["request"] = JolokiaRequest.model_construct(**request)
 
-    async def request(self, operations: Iterable[JolokiaRequest]) -> AsyncGenerator[JolokiaResponse, None]:
+        if (history := fields.get("history")) is not None:
+            fields["history"] = HistorySeries.from_history(history)
+
+        return JolokiaResponse.model_construct(**fields)
+
+    @staticmethod
+    def _encode(operations: Iterable[JolokiaRequest]) -> bytearray:
+        """Join pre-serialized operations into JSON array, growing single buffer in place."""
+
+        data = bytearray(b"[")
+        for request in operations:
+            if len(data) > 1:
+                data += b","
+            data += request.encoded
+        data += b"]"
+
+        return data
+
+    def _get_session(self) -> ClientSession:
+        """Return `aiohttp.ClientSession` shared by all requests, creating it on first call."""
+
+        # Session is created lazily on first request and reused afterwards so keep-alive connections
+        # are shared between calls. Instanciating it in .__init__() may lead to the situation when
+        # JolokiaClient is created before event loop even starts (e.g. on __module__ level before
+        # asyncio.run() or in .__init__() of any class, which is synchronous). Connector is tuned for
+        # steady polling of few hosts: idle connections are kept warm and DNS lookups are cached.
+        if self._session is None:
+            self._session = ClientSession(
+                auth=self._auth,
+                connector=TCPConnector(
+                    limit=self._max_conns,
+                    limit_per_host=self._max_conns,
+                    keepalive_timeout=self._keepalive,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                    force_close=False,
+                ),
+            )
+
+        return self._session
+
+    async def _post(self, operations: Iterable[JolokiaRequest]) -> bytes:
+        """Make bulk POST request to Jolokia and return raw response body."""
+
+        async with self._get_session().post(url=self._base_url, data=self._encode(operations)) as jolokia_response:
+            return await jolokia_response.read()
+
+    async def _iter_chunks(self, operations: Iterable[JolokiaRequest]) -> AsyncGenerator[bytes, None]:
+        """Make bulk POST request to Jolokia and return raw response body in chunks as they arrive."""
+
+        async with self._get_session().post(url=self._base_url, data=self._encode(operations)) as jolokia_response:
+            async for chunk in jolokia_response.content.iter_chunked(_CHUNK_SIZE):
+                yield chunk
+
+    async def _stream_json(self, operations: Iterable[JolokiaRequest]) -> AsyncGenerator[Any, None]:
         """
-        Make bulk POST request to Jolokia and return response object.
+        Make bulk POST request to Jolokia and return every item of JSON array as soon as it is parsed.
+
+        Response body is fed into `ijson` incremental parser chunk by chunk. Global error response is
+        single JSON object instead of array of results, so it is read entirely and returned as sole item.
+        """
+
+        if ijson is None:
+            raise ImportError("Streaming responses requires `ijson` package to be installed.")
+
+        async with aclosing(self._iter_chunks(operations)) as chunks:
+            # Find out kind of response by first significant byte
+            head = bytearray()
+            async for chunk in chunks:
+                head += chunk
+                if head.lstrip():
+                    break
+
+            if not head.lstrip().startswith(b"["):
+                async for chunk in chunks:
+                    head += chunk
+                yield orjson.loads(head)
+                return
+
+            items: list[Any] = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            parser.send(bytes(head))
+
+            # Return items parsed so far before feeding next chunk
+            async for chunk in chunks:
+                for item in items:
+                    yield item
+                del items[:]
+                parser.send(chunk)
+
+            parser.close()
+            for item in items:
+                yield item
+
+    async def fetch_json(self, operations: Iterable[JolokiaRequest]) -> Iterable[Any]:
+        """
+        Make bulk POST request to Jolokia and return JSON response.
 
         See https://jolokia.org/reference/html/protocol.html#post-request.
         """
 
-        # Iterate over every response ensuring what received data is Sequence
-        # (just in case of global exception happened) and try to parse every
-        # item as JolokiaResponce object.
+        return orjson.loads(await self._post(operations))
 
-        exceptions: list[Exception] = []
-        json_obj: Any = await self.fetch_json(operations)
+    async def _results(
+        self,
+        operations: Iterable[JolokiaRequest],
+        strict: bool,
+        stream: bool,
+    ) -> AsyncGenerator[Any, None]:
+        """Make bulk POST request to Jolokia and return every item of response as JSON object or `JolokiaResponse`."""
+
+        if stream:
+            async for result in self._stream_json(operations):
+                yield result
+            return
+
+        # Ensure what received data is Sequence (just in case of global exception happened). Strict mode
+        # validates raw bytes in single pass, otherwise trusted JSON is decoded with orjson.
+        raw: bytes = await self._post(operations)
+
+        if strict:
+            parsed: list[JolokiaResponse] | JolokiaResponse = _RESPONSES.validate_json(raw)
+            for response in parsed if isinstance(parsed, list) else (parsed,):
+                yield response
+            return
+
+        json_obj: Any = orjson.loads(raw)
         if not isinstance(json_obj, Sequence):
             json_obj = [json_obj]
 
         for result in json_obj:
-            response = JolokiaResponse(**result)
+            yield result
 
-            if response.status >= 400:
-                exceptions.append(self._build_exception(response))
+    async def _iter_responses(
+        self,
+        results: AsyncGenerator[Any, None],
+        strict: bool = False,
+    ) -> AsyncGenerator[JolokiaResponse, None]:
+        """
+        Convert results of bulk request into `JolokiaResponse` objects.
+
+        JSON objects are validated or constructed depending on `strict`, already parsed `JolokiaResponse` objects are
+        returned as is. If `raise_exceptions` is enabled, error responses are raised as `ExceptionGroup` after the last one.
+
+        Args:
+            results: results of bulk request in order of operations, closed when iteration stops.
+            strict: set to `True` to validate every response with Pydantic instead of trusting Jolokia output.
+        """
+
+        exceptions: list[Exception] = []
+        async with aclosing(results):
+            async for result in results:
+                if isinstance(result, JolokiaResponse):
+                    response = result
+                else:
+                    response = JolokiaResponse.model_validate(result) if strict else self._construct_response(result)
 
-            yield response
+                if response.status >= 400:
+                    exceptions.append(self._build_exception(response))
+
+                yield response
 
         # Raise all exceptions if asked to
         if self._raise and exceptions:
             raise ExceptionGroup("JolokiaException", exceptions)
 
-    @property
+    async def request(
+        self,
+        operations: Iterable[JolokiaRequest],
+        strict: bool = False,
+        stream: bool = False,
+    ) -> AsyncGenerator[JolokiaResponse, None]:
+        """
+        Make bulk POST request to Jolokia and return response object.
+
+        See https://jolokia.org/reference/html/protocol.html#post-request.
+
+        Args:
+            operations: requests to send in single bulk POST request.
+            strict: set to `True` to validate every response with Pydantic instead of trusting Jolokia output.
+            stream: set to `True` to parse response incrementally and return every result as soon as it is received
+                instead of reading whole response first (requires `ijson` package).
+        """
+
+        results = self._results(operations, strict=strict, stream=stream)
+        async with aclosing(self._iter_responses(results, strict=strict)) as responses:
+            async for response in responses:
+                yield response
+
+    def invalidate_version_cache(self) -> None:
+        """Forget cached agent version information, e.g. after Jolokia agent restart or upgrade."""
+
+        self._version_cache = None
+
     async def version(self) -> JolokiaVersion:
-        """Jolokia agent version information."""
+        """Jolokia agent version information, requested once and cached afterwards."""
+
+        if self._version_cache is not None:
+            return self._version_cache
 
         # Make bulk request with single operation and extract its (first) result
         # Ignoring type since without return_json this will always try to return JolokiaResponce
@@ -114,7 +344,8 @@ class JolokiaClient:
 
         # Convert to `JolokiaVersion` object for convenience.
         if response.status == 200:
-            return JolokiaVersion(**response.value)  # type: ignore
+            self._version_cache = JolokiaVersion.model_validate(response.value)
+            return self._version_cache
 
         exc: Exception | None = self._build_exception(response)
         raise exc if exc else RuntimeError("Undefined exception happened while requesting version.")
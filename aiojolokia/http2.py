@@ -0,0 +1,86 @@
+# -*- mode: python ; coding: utf-8 -*-
+
+"""
+HTTP/2-capable Jolokia API client based on httpx.
+
+Requires optional `httpx[http2]` package.
+"""
+
+from typing import AsyncGenerator, Iterable
+
+import httpx
+
+from aiohttp.helpers import BasicAuth
+from aiohttp.typedefs import StrOrURL
+
+from aiojolokia.client import _CHUNK_SIZE, JolokiaClient
+from aiojolokia.models import JolokiaRequest
+
+
+class Http2JolokiaClient(JolokiaClient):
+    """
+    Pydantic-driven httpx-based Jookia API client.
+
+    Behaves the same way as `JolokiaClient`, but sends requests with `httpx.AsyncClient`, which negotiates HTTP/2 with
+    servers supporting it (e.g. HTTPS load balancers), so concurrent bulk requests are multiplexed over single connection.
+    """
+
+    def __init__(
+        self,
+        base_url: StrOrURL,
+        auth: BasicAuth | None = None,
+        raise_exceptions: bool = False,
+        max_conns: int = 10,
+        keepalive: float = 75,
+    ) -> None:
+        """
+        Pydantic-driven httpx-based Jookia API client.
+
+        Args:
+            base_url: base Jolokia URL (usually `https://<host>:<post>/jolokia`)
+            auth: tuple of `login` and `password` and optional `encoding` for HTTP Basic authentication.
+            raise_exceptions: set to `True` to receive `ExceptionGroup` based on Jolokia error responses.
+            max_conns: maximum number of simultaneous connections to Jolokia.
+            keepalive: seconds to keep idle connection open, should exceed polling interval to reuse connections.
+        """
+
+        super().__init__(base_url, auth=auth, raise_exceptions=raise_exceptions, max_conns=max_conns, keepalive=keepalive)
+        self._http: httpx.AsyncClient | None = None
+
+    async def close(self) -> None:
+        """Close underlying `httpx.AsyncClient` if it was ever opened."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+        await super().close()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return `httpx.AsyncClient` shared by all requests, creating it on first call."""
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                auth=httpx.BasicAuth(self._auth.login, self._auth.password) if self._auth else None,
+                limits=httpx.Limits(
+                    max_connections=self._max_conns,
+                    max_keepalive_connections=self._max_conns,
+                    keepalive_expiry=self._keepalive,
+                ),
+            )
+
+        return self._http
+
+    async def _post(self, operations: Iterable[JolokiaRequest]) -> bytes:
+        """Make bulk POST request to Jolokia and return raw response body."""
+
+        response = await self._get_http().post(str(self._base_url), content=bytes(self._encode(operations)))
+        return response.content
+
+    async def _iter_chunks(self, operations: Iterable[JolokiaRequest]) -> AsyncGenerator[bytes, None]:
+        """Make bulk POST request to Jolokia and return raw response body in chunks as they arrive."""
+
+        async with self._get_http().stream("POST", str(self._base_url), content=bytes(self._encode(operations))) as response:
+            async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                yield chunk
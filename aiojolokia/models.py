@@ -7,22 +7,23 @@ See https://jolokia.org/reference/html/protocol.html.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Any, Iterable, Literal, Mapping
+from enum import StrEnum
+from functools import cached_property, partial
+from typing import Any, Callable, Iterable, Iterator, Literal, Mapping, Self, Sequence
 
-from pydantic import BaseModel  # pylint: disable=no-name-in-module
-from pydantic import validator  # type: ignore
-from pydantic import Field
+import orjson
 
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import to_jsonable_python
 
-# pylint: disable=unused-argument
-def _convert_timestamp(cls: object, timestamp: int | None) -> datetime | None:
-    """Convert timestamp field with unixtime into `datetime.datetime()` object."""
+
+def _from_timestamp(timestamp: int | None) -> datetime | None:
+    """Convert unixtime into `datetime.datetime()` object."""
 
     return datetime.fromtimestamp(timestamp) if timestamp is not None else None
 
 
-class Operation(Enum):
+class Operation(StrEnum):
     """
     See section 6.2 of Jolokia protocol specification:
 
@@ -36,8 +37,45 @@ class Operation(Enum):
     LIST = "list"
     VERSION = "version"
 
-    def __str__(self) -> str:
-        return self.value
+
+# Request fields meaningful for every operation, in order of `JolokiaRequest` fields
+_OPERATION_FIELDS: dict[Operation, tuple[str, ...]] = {
+    Operation.READ: ("mbean", "attribute", "path"),
+    Operation.WRITE: ("mbean", "attribute", "path", "value"),
+    Operation.EXEC: ("mbean", "path", "operation_name", "arguments"),
+    Operation.SEARCH: ("mbean",),
+    Operation.LIST: ("path",),
+    Operation.VERSION: (),
+}
+
+
+# Converts values which orjson cannot serialize natively the same way as `.model_dump(exclude_none=True, by_alias=True)`
+_to_jsonable: Callable[[Any], Any] = partial(to_jsonable_python, exclude_none=True, by_alias=True)
+
+
+def _build_encoder(operation: Operation, fields: tuple[tuple[str, str], ...]) -> Callable[[Any], bytes]:
+    """
+    Generate JSON encoder specialized for requests of given operation.
+
+    `fields` are pairs of model field name and its JSON key. Encoder writes `type` as constant and only checks fields
+    used by the operation instead of walking every model field. Values orjson cannot serialize natively (e.g. Pydantic
+    models, sets or decimals) are converted to JSON-compatible objects by Pydantic.
+    """
+
+    name = f"_encode_{operation.value}"
+    head: bytes = b'{"type":' + orjson.dumps(operation.value)
+    lines = [f"def {name}(request):", f"    data = bytearray({head!r})"]
+    for field, alias in fields:
+        key: bytes = b"," + orjson.dumps(alias) + b":"
+        lines.append(f"    if request.{field} is not None:")
+        lines.append(f"        data += {key!r} + dumps(request.{field})")
+    lines.append("    data += b'}'")
+    lines.append("    return bytes(data)")
+
+    namespace: dict[str, Any] = {"dumps": partial(orjson.dumps, default=_to_jsonable)}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+
+    return namespace[name]
 
 
 # pylint: disable=too-few-public-methods
@@ -73,7 +111,7 @@ class RequestConfig(BaseModel):
     )
 
     mimeType: Literal["text/plain"] | Literal["application/json"] = Field(
-        default=Literal["text/plain"],
+        default="text/plain",
         alias="mime_type",
         description="The MIME type to return for the response. By default, this is `text/plain`, but it can be useful for some tools to change it to `application/json`. Init parameters can be used to change the default mime type. Only `text/plain` and `application/json` are allowed. For any other value Jolokia will fallback to `text/plain`.",
     )
@@ -121,7 +159,13 @@ class ProxyTarget(BaseModel):
 
 # pylint: disable=too-few-public-methods
 class JolokiaRequest(BaseModel):
-    """Base class for Jolokia requests."""
+    """
+    Base class for Jolokia requests.
+
+    Requests are immutable, so the same objects may be sent repeatedly (e.g. in polling loop) and serialized only once.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     type: Operation
 
@@ -134,19 +178,60 @@ class JolokiaRequest(BaseModel):
     value: Any | None = None
 
     # For exec requests
-    operation_name: str | None = None
-    arguments: Iterable[Any] | None = None
+    operation_name: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("operation_name", "operation"),
+        serialization_alias="operation",
+    )
+    arguments: Sequence[Any] | None = None
+
+    @cached_property
+    def encoded(self) -> bytes:
+        """Request serialized to JSON, computed on first access and reused afterwards."""
+
+        # Subclasses may declare more fields (e.g. proxy `target`) which are unknown to generated encoders
+        encoder: Callable[[Any], bytes] | None = _ENCODERS.get(self.type) if type(self) is JolokiaRequest else None
+        if encoder is not None:
+            return encoder(self)
+
+        # Python mode dump may still hold e.g. sets or decimals, which are converted the same way as by encoders
+        return orjson.dumps(self.model_dump(exclude_none=True, by_alias=True), default=_to_jsonable)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        # Cached JSON is copied along with instance `__dict__` and would be stale after update
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("encoded", None)
+        return copied
+
+    def _key(self) -> tuple[Any, ...]:
+        """Tuple of meaningful fields used for comparison and hashing."""
+
+        # Order sligtly matters for performance since tuples are compared item by item
+        return (
+            self.type,
+            self.mbean,
+            self.attribute,
+            self.path,
+            self.value,
+            self.operation_name,
+            tuple(self.arguments) if self.arguments is not None else None,
+        )
 
     def __eq__(self, __value: object) -> bool:
-        if not isinstance(__value, JolokiaRequest):
-            return False
+        return isinstance(__value, JolokiaRequest) and self._key() == __value._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
-        # Order sligtly matters for performance
-        for attr in ("type", "mbean", "attribute", "path", "value", "operation_name", "arguments"):
-            if self.__getattribute__(attr) != __value.__getattribute__(attr):
-                return False
 
-        return True
+# Encoders are built after `JolokiaRequest`, since JSON keys are taken from its field aliases (e.g. `operation`)
+_ENCODERS: dict[Operation, Callable[[Any], bytes]] = {
+    operation: _build_encoder(
+        operation,
+        tuple((field, JolokiaRequest.model_fields[field].serialization_alias or field) for field in fields),
+    )
+    for operation, fields in _OPERATION_FIELDS.items()
+}
 
 
 # pylint: disable=too-few-public-methods
@@ -160,7 +245,101 @@ class HistoricalValue(BaseModel):
     value: Any
     timestamp: int | None = None
 
-    _convert_timestamp = validator("timestamp", allow_reuse=True)(_convert_timestamp)  # type: ignore
+    @property
+    def timestamp_dt(self) -> datetime | None:
+        """`timestamp` converted into `datetime.datetime()` object on access."""
+
+        return _from_timestamp(self.timestamp)
+
+
+class HistorySeries(BaseModel):
+    """
+    Historical values stored column-wise: values and their timestamps as two parallel lists.
+
+    Avoids creating model object per every point of long history. Use `.iter_points()` to get `HistoricalValue` objects.
+    See https://jolokia.org/reference/html/protocol.html#history.
+    """
+
+    # Otherwise any mapping would silently validate as empty series
+    model_config = ConfigDict(extra="forbid")
+
+    values: list[Any] = []
+    timestamps: list[int | None] = []
+
+    @staticmethod
+    def columns(points: Iterable[Mapping[str, Any] | HistoricalValue]) -> dict[str, list[Any]]:
+        """Split array of historical values (as received from Jolokia) into `values` and `timestamps` columns."""
+
+        values: list[Any] = []
+        timestamps: list[Any] = []
+        for point in points:
+            if isinstance(point, HistoricalValue):
+                values.append(point.value)
+                timestamps.append(point.timestamp)
+            elif isinstance(point, Mapping):
+                values.append(point.get("value"))
+                timestamps.append(point.get("timestamp"))
+            else:
+                raise ValueError(f"Malformed Jolokia history: expected object with `value` and `timestamp`, got {point!r}.")
+
+        return {"values": values, "timestamps": timestamps}
+
+    @classmethod
+    def from_history(cls, history: Any, strict: bool = False, columned: bool = False) -> Any:
+        """
+        Convert `history` received from Jolokia into `HistorySeries`.
+
+        Reading single attribute returns array of values, reading multiple attributes returns it per attribute name,
+        and pattern read returns it per MBean name and attribute name, so mappings of series are returned for the latter.
+
+        Args:
+            history: `history` of Jolokia response.
+            strict: set to `True` to validate series with Pydantic instead of trusting Jolokia output.
+            columned: set to `True` to also accept series already split into columns, e.g. of dumped `JolokiaResponse`.
+        """
+
+        if isinstance(history, HistorySeries):
+            return history
+
+        if isinstance(history, Sequence) and not isinstance(history, str):
+            columns: dict[str, list[Any]] = cls.columns(history)
+            return cls.model_validate(columns) if strict else cls.model_construct(**columns)
+
+        if isinstance(history, Mapping):
+            if columned and cls._is_columns(history):
+                return cls.model_validate(history) if strict else cls.model_construct(**history)
+
+            return {key: cls.from_history(value, strict, columned) for key, value in history.items()}
+
+        raise ValueError(f"Malformed Jolokia history: expected array or object, got {history!r}.")
+
+    @staticmethod
+    def _is_columns(history: Mapping[str, Any]) -> bool:
+        """
+        Check if mapping is columned series rather than history of attributes named `values` and `timestamps`.
+
+        Jolokia returns every attribute history as array of objects, which never holds timestamps on its own.
+        """
+
+        if history.keys() != {"values", "timestamps"}:
+            return False
+
+        values, timestamps = history["values"], history["timestamps"]
+        if not isinstance(values, list) or not isinstance(timestamps, list) or len(values) != len(timestamps):
+            return False
+
+        return all(timestamp is None or isinstance(timestamp, int) for timestamp in timestamps) and not any(
+            isinstance(value, Mapping) and "timestamp" in value for value in values
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def iter_points(self) -> Iterator[HistoricalValue]:
+        """Iterate over history as `HistoricalValue` objects."""
+
+        for value, timestamp in zip(self.values, self.timestamps):
+            yield HistoricalValue.model_construct(value=value, timestamp=timestamp)
 
 
 # pylint: disable=too-few-public-methods
@@ -169,7 +348,7 @@ class JolokiaResponse(BaseModel):
 
     status: int
     value: Any | None = None
-    history: Iterable[HistoricalValue] | None = None
+    history: HistorySeries | dict[str, HistorySeries] | dict[str, dict[str, HistorySeries]] | None = None
     request: JolokiaRequest | None = None
     timestamp: int | None = None
 
@@ -177,7 +356,18 @@ class JolokiaResponse(BaseModel):
     error: str | None = None
     stacktrace: str | None = None
 
-    _convert_timestamp = validator("timestamp", allow_reuse=True)(_convert_timestamp)  # type: ignore
+    @field_validator("history", mode="before")
+    @classmethod
+    def _history_columns(cls, history: Any) -> Any:
+        """Convert historical values received from Jolokia into `HistorySeries` columns."""
+
+        return HistorySeries.from_history(history, strict=True, columned=True) if history is not None else None
+
+    @property
+    def timestamp_dt(self) -> datetime | None:
+        """`timestamp` converted into `datetime.datetime()` object on access."""
+
+        return _from_timestamp(self.timestamp)
 
 
 # pylint: disable=too-few-public-methods
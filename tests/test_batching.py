@@ -0,0 +1,156 @@
+# -*- mode: python ; coding: utf-8 -*-
+
+"""Tests of `AsyncBatchingJolokiaClient` against local `aiohttp.web` server."""
+
+import asyncio
+import unittest
+
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojolokia import AsyncBatchingJolokiaClient, JolokiaClient, JolokiaRequest
+
+VERSION = JolokiaRequest(type="version")
+LIST = JolokiaRequest(type="list")
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    """Let other tasks run until condition is met."""
+
+    while not condition():
+        await asyncio.sleep(0)
+
+
+class BatchingTestCase(unittest.IsolatedAsyncioTestCase):
+    """Bulk requests are answered by `respond` coroutine, which receives operations of every received bulk request."""
+
+    async def asyncSetUp(self) -> None:
+        self.bodies: list[list[Any]] = []
+        self.respond: Callable[[list[Any]], Awaitable[Any]] = self._echo
+
+        app = web.Application()
+        app.router.add_post("/jolokia", self._handler)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def _handler(self, request: web.Request) -> web.Response:
+        body: list[Any] = orjson.loads(await request.read())
+        self.bodies.append(body)
+
+        return web.Response(body=orjson.dumps(await self.respond(body)), content_type="application/json")
+
+    @staticmethod
+    async def _echo(body: list[Any]) -> Any:
+        return [{"request": operation, "status": 200, "value": index} for index, operation in enumerate(body)]
+
+    def _client(self, **kwargs: Any) -> AsyncBatchingJolokiaClient:
+        return AsyncBatchingJolokiaClient(JolokiaClient(self.server.make_url("/jolokia")), **kwargs)
+
+    async def test_batches_concurrent_callers(self) -> None:
+        async with self._client(wait_timeout=0.05) as client:
+            results = await asyncio.gather(client.fetch_json([VERSION]), client.fetch_json([LIST, VERSION]))
+
+        self.assertEqual(len(self.bodies), 1)
+        self.assertEqual([[result["value"] for result in caller] for caller in results], [[0], [1, 2]])
+
+    async def test_close_while_collecting(self) -> None:
+        client = self._client(wait_timeout=10)
+        task = asyncio.create_task(client.fetch_json([VERSION]))
+
+        # Worker took the operation from queue and waits for more of them
+        await _until(lambda: client._queue is not None and client._queue.empty())  # pylint: disable=protected-access
+        await client.close()
+
+        with self.assertRaisesRegex(RuntimeError, "before request was sent"):
+            await asyncio.wait_for(task, 1)
+
+        self.assertEqual(self.bodies, [])
+
+    async def test_close_while_fetching(self) -> None:
+        received = asyncio.Event()
+        release = asyncio.Event()
+
+        async def respond(body: list[Any]) -> Any:
+            received.set()
+            await release.wait()
+            return await self._echo(body)
+
+        self.respond = respond
+        client = self._client()
+        task = asyncio.create_task(client.fetch_json([VERSION]))
+
+        await asyncio.wait_for(received.wait(), 1)
+        await client.close()
+        release.set()
+
+        with self.assertRaisesRegex(RuntimeError, "before response was received"):
+            await asyncio.wait_for(task, 1)
+
+    async def test_short_response(self) -> None:
+        async def respond(body: list[Any]) -> Any:
+            return (await self._echo(body))[:1]
+
+        self.respond = respond
+        async with self._client(wait_timeout=0.05) as client:
+            first, second = await asyncio.wait_for(
+                asyncio.gather(client.fetch_json([VERSION]), client.fetch_json([LIST]), return_exceptions=True),
+                1,
+            )
+
+        self.assertEqual(first, [{"request": {"type": "version"}, "status": 200, "value": 0}])
+        self.assertIsInstance(second, RuntimeError)
+        self.assertIn("1 results for bulk request of 2 operations", str(second))
+
+    async def test_global_error(self) -> None:
+        error = {"status": 500, "error_type": "java.lang.IllegalStateException", "error": "Global error"}
+
+        async def respond(body: list[Any]) -> Any:
+            return error
+
+        self.respond = respond
+        async with self._client(wait_timeout=0.05) as client:
+            results = await asyncio.gather(*(client.fetch_json([VERSION]) for _ in range(3)))
+            responses = [response async for response in client.request([VERSION])]
+
+        self.assertEqual(results, [[error]] * 3)
+        self.assertEqual([response.status for response in responses], [500])
+
+    async def test_caller_cancelled(self) -> None:
+        async with self._client(wait_timeout=0.05) as client:
+            cancelled = asyncio.create_task(client.fetch_json([LIST]))
+            waiting = asyncio.create_task(client.fetch_json([VERSION]))
+
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            results = await asyncio.wait_for(waiting, 1)
+
+            # Worker keeps serving callers afterwards
+            later = await asyncio.wait_for(client.fetch_json([LIST]), 1)
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.bodies, [[{"type": "version"}], [{"type": "list"}]])
+        self.assertEqual([result["value"] for result in results], [0])
+        self.assertEqual([result["value"] for result in later], [0])
+
+    async def test_request_stopped_early(self) -> None:
+        async with self._client(wait_timeout=0.05) as client:
+            async for response in client.request([VERSION, LIST]):
+                self.assertEqual(response.status, 200)
+                break
+
+            responses = [response async for response in client.request([LIST])]
+
+        self.assertEqual([response.status for response in responses], [200])
+
+
+if __name__ == "__main__":
+    unittest.main()